@@ -13,7 +13,7 @@ __all__ = (
 lea.set_prob_type("r")
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class AttackCounter:
     # TODO: addition operator?
     attacks: int